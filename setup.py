@@ -16,7 +16,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/dainstudios/untidy",
-    install_requires=["numpy>=1.10.4", "pandas>=0.17.1"],
+    install_requires=["numpy>=1.17.0", "pandas>=0.17.1"],
     extras_require={"dev": ["pytest>=6.2.0"], "examples": ["jupyter", "seaborn>=0.7.0"]},
     classifiers=[
         "Programming Language :: Python :: 3.8",
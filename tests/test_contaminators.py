@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+import pytest
+import warnings
 
 from untidy.contaminators import (
     get_random_cols,
@@ -11,7 +13,10 @@ from untidy.contaminators import (
     add_duplicate_rows,
     add_outliers,
     add_duplicate_columns,
+    get_untidy_shape,
 )
+from untidy import contaminators
+from untidy.main import untidyfy
 
 data = pd.DataFrame(
     {
@@ -164,3 +169,191 @@ def test_add_duplicate_rows():
 def test_add_duplicate_columns():
     dup_cols = add_duplicate_columns(data)
     assert dup_cols.shape[1] > data.shape[1]
+
+
+""" Threaded column contamination """
+
+
+def test_threaded_contamination_is_deterministic():
+    for contaminate in [add_nans, add_outliers]:
+        single = contaminate(data, threads=1, seed=42)
+        multi = contaminate(data, threads=4, seed=42)
+
+        # same seed gives the same output regardless of the number of threads
+        assert single.equals(multi), f"{contaminate.__name__} is not deterministic"
+        assert not single.equals(data), f"{contaminate.__name__} left data untouched"
+
+
+def test_seeded_contamination_without_threads():
+    for contaminate in [add_nans, add_outliers, change_numeric_to_str]:
+        assert contaminate(data, seed=7).equals(contaminate(data, seed=7))
+
+
+def test_seed_sequence_can_be_reused():
+    seed = np.random.SeedSequence(5)
+
+    assert add_nans(data, seed=seed).equals(add_nans(data, seed=seed))
+    assert untidyfy(data, seed=seed, verbose=False).equals(
+        untidyfy(data, seed=seed, verbose=False)
+    )
+
+
+def test_threads_use_thread_pool(monkeypatch):
+    pools = []
+
+    class RecordingThreadPoolExecutor(contaminators.ThreadPoolExecutor):
+        def __init__(self, max_workers=None):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(
+        contaminators, "ThreadPoolExecutor", RecordingThreadPoolExecutor
+    )
+    add_nans(data, threads=3, seed=0)
+    add_outliers(data, threads=2, seed=0)
+    add_nans(data, seed=0)
+
+    assert pools == [3, 2]
+
+
+def test_untidyfy_is_deterministic():
+    messy_1 = untidyfy(data, threads=4, seed=42, verbose=False)
+    messy_2 = untidyfy(data, threads=2, seed=42, verbose=False)
+
+    assert messy_1.equals(messy_2)
+    assert list(messy_1.columns) == list(messy_2.columns)
+
+
+def test_threaded_add_outliers_to_32_bit_columns():
+    data_32 = data.astype({"num1": "float32", "num2": "int32"})
+    outlier_df = add_outliers(data_32, threads=2, seed=0)
+
+    assert (outlier_df["num1"] - data_32["num1"] > 0).any()
+    assert (outlier_df["num2"] - data_32["num2"] > 0).any()
+
+
+def test_threaded_add_nans():
+    nan_df = add_nans(data, threads=2, seed=0)
+
+    assert nan_df.shape == data.shape
+    assert nan_df.isna().any().any() or (nan_df == "?").any().any()
+
+
+def test_threaded_add_outliers():
+    outlier_df = add_outliers(data, threads=2, seed=0)
+
+    # string columns are untouched, numeric columns get larger values
+    assert outlier_df[["str1", "str2"]].equals(data[["str1", "str2"]])
+    assert (outlier_df["num1"] - data["num1"] > 0).any()
+    assert (outlier_df["num2"] - data["num2"] > 0).any()
+
+
+""" NumPy arrays """
+
+array = np.column_stack([np.linspace(0, 20, 21), np.arange(21)])
+
+
+def test_array_add_nans_and_outliers():
+    nan_array = add_nans(array, seed=0, block_size=5)
+    outlier_array = add_outliers(array, seed=0, block_size=5)
+
+    assert nan_array.shape == array.shape
+    assert np.isnan(nan_array).any()
+    assert (outlier_array > array).any()
+
+
+def test_array_output_does_not_depend_on_block_size_or_threads():
+    wide = np.random.default_rng(0).normal(size=(100, 8))
+    messy = untidyfy(wide, seed=0, block_size=7, verbose=False)
+
+    np.testing.assert_array_equal(
+        messy, untidyfy(wide, seed=0, block_size=100, verbose=False)
+    )
+    np.testing.assert_array_equal(
+        messy, untidyfy(wide, seed=0, block_size=13, threads=4, verbose=False)
+    )
+
+
+def test_array_threads_use_thread_pool(monkeypatch):
+    pools = []
+
+    class RecordingThreadPoolExecutor(contaminators.ThreadPoolExecutor):
+        def __init__(self, max_workers=None):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(
+        contaminators, "ThreadPoolExecutor", RecordingThreadPoolExecutor
+    )
+    add_nans(array, threads=3, seed=0, block_size=5)
+    untidyfy(array, threads=2, seed=0, verbose=False)
+
+    assert pools == [3, 2]
+
+
+def test_array_add_outliers_skips_columns_without_range():
+    columns = np.column_stack(
+        [np.ones(21), np.full(21, np.nan), np.linspace(0, 20, 21)]
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        outlier_array = add_outliers(columns, seed=0)
+        add_outliers(np.empty((0, 3)), seed=0)
+
+    np.testing.assert_array_equal(outlier_array[:, :2], columns[:, :2])
+    assert (outlier_array[:, 2] > columns[:, 2]).any()
+
+
+def test_array_add_outliers_to_large_integers():
+    large = np.arange(1000, dtype=np.int64)[:, None] * 10**14
+    outlier_array = add_outliers(large, corruption_level=10, seed=0)
+
+    # outliers are clipped to the integer range instead of overflowing
+    assert outlier_array.dtype == large.dtype
+    assert (outlier_array >= large).all()
+    assert (outlier_array > large.max()).any()
+
+
+def test_array_out_is_checked():
+    with pytest.raises(ValueError):
+        add_nans(array, out=np.empty((3, 3)))
+    with pytest.raises(ValueError):
+        add_nans(array, out=np.empty(array.shape, dtype=np.int8))
+
+
+def test_array_duplicates():
+    dup_rows = add_duplicate_rows(array, seed=0, block_size=5)
+    dup_cols = add_duplicate_columns(array, seed=0, block_size=5)
+
+    assert dup_rows.shape[0] > array.shape[0]
+    assert np.array_equal(np.unique(dup_rows, axis=0), array)
+    assert dup_cols.shape[1] > array.shape[1]
+
+
+def test_untidyfy_memmap(tmp_path):
+    clean = np.lib.format.open_memmap(
+        tmp_path / "clean.npy", mode="w+", dtype=array.dtype, shape=array.shape
+    )
+    clean[:] = array
+    out = np.lib.format.open_memmap(
+        tmp_path / "messy.npy",
+        mode="w+",
+        dtype=array.dtype,
+        shape=get_untidy_shape(clean),
+    )
+    messy = untidyfy(clean, out=out, seed=0, block_size=5, verbose=False)
+
+    assert messy is out
+    assert np.array_equal(clean, array)
+    assert np.isnan(np.load(tmp_path / "messy.npy")).any()
+
+
+def test_untidyfy_structured_array():
+    clean = np.zeros(21, dtype=[("num", "f8"), ("str", "U5")])
+    clean["num"] = np.arange(21)
+    clean["str"] = "a"
+    messy = untidyfy(clean, seed=0, verbose=False)
+
+    assert messy.dtype == clean.dtype
+    assert messy.shape == get_untidy_shape(clean)
+    assert np.isnan(messy["num"]).any() and (messy["str"] == "?").any()
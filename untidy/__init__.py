@@ -6,6 +6,7 @@ from untidy.contaminators import (
     add_outliers,
     change_str_encoding,
     change_numeric_to_str,
+    get_untidy_shape,
 )
 
 from untidy.main import untidyfy
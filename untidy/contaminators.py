@@ -5,12 +5,15 @@ import numpy as np
 import pandas as pd
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
 
 
 """ Helpers """
 
 
-def get_random_cols(data, col_type="any", corruption_level=4, return_index=False):
+def get_random_cols(
+    data, col_type="any", corruption_level=4, return_index=False, rng=None
+):
     """
     Get random columns to contaminate
 
@@ -25,6 +28,8 @@ def get_random_cols(data, col_type="any", corruption_level=4, return_index=False
         is the highest level of contamination
     return_index: boolean, optional
         Whether to return column indeces. Returns column names if False. Defaults to False.
+    rng: np.random.Generator, optional
+        Generator to sample with. Uses the global `random` state if None. Defaults to None.
 
     Returns
     -------
@@ -62,12 +67,18 @@ def get_random_cols(data, col_type="any", corruption_level=4, return_index=False
     ][corruption_level]
 
     # Sample columns
-    cols = random.choices(cols_to_sample, k=num_contaminated)
+    if rng is None:
+        cols = random.choices(cols_to_sample, k=num_contaminated)
+    else:
+        cols = [
+            cols_to_sample[i]
+            for i in rng.integers(0, len(cols_to_sample), size=num_contaminated)
+        ]
 
     return cols
 
 
-def get_random_indices(data, col_type="any", corruption_level=4):
+def get_random_indices(data, col_type="any", corruption_level=4, rng=None):
     """
     Get random indeces to contaminate
 
@@ -80,6 +91,8 @@ def get_random_indices(data, col_type="any", corruption_level=4):
     corruption_level int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    rng: np.random.Generator, optional
+        Generator to sample with. Uses the global `random` state if None. Defaults to None.
 
     Returns
     -------
@@ -107,21 +120,401 @@ def get_random_indices(data, col_type="any", corruption_level=4):
             cols_to_sample = list(range(len(data.columns)))
         else:
             cols_to_sample = sampling_cols(data, type_dict[col_type])
-        sampled_col_idx = random.choices(cols_to_sample, k=num_contaminated)
-        sampled_row_idx = random.choices(list(range(len(data))), k=num_contaminated)
-        idx = list(set(zip(sampled_row_idx, sampled_col_idx)))
+        if rng is None:
+            sampled_col_idx = random.choices(cols_to_sample, k=num_contaminated)
+            sampled_row_idx = random.choices(
+                list(range(len(data))), k=num_contaminated
+            )
+        else:
+            sampled_col_idx = [
+                cols_to_sample[i]
+                for i in rng.integers(0, len(cols_to_sample), size=num_contaminated)
+            ]
+            sampled_row_idx = rng.integers(0, len(data), size=num_contaminated).tolist()
+        idx = sorted(set(zip(sampled_row_idx, sampled_col_idx)))
     elif isinstance(data, pd.Series):
-        idx = list(data.sample(n=num_contaminated).index)
+        if rng is None:
+            idx = list(data.sample(n=num_contaminated).index)
+        else:
+            rows = rng.choice(len(data), size=num_contaminated, replace=False)
+            idx = list(data.index[rows])
     else:
         raise TypeError("data should be pd.Series or pd.DataFrame")
 
     return idx
 
 
+def get_seed_sequences(n, seed=None):
+    """
+    Get independent seed sequences, eg. one per contamination step
+
+    Parameters
+    ----------
+    n: int
+        number of seed sequences to create
+    seed: int, np.random.SeedSequence or None, optional
+        seed to spawn from. The same seed always gives the same seed sequences, also when
+        the same np.random.SeedSequence is passed again.
+
+    Returns
+    -------
+    seeds: list
+        list of np.random.SeedSequence
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        # Spawn from a copy, as spawning advances the state of the caller's sequence
+        seed = np.random.SeedSequence(
+            seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size
+        )
+    else:
+        seed = np.random.SeedSequence(seed)
+
+    return seed.spawn(n)
+
+
+def get_column_generators(n_cols, seed=None):
+    """
+    Get one independent random generator per column
+
+    Parameters
+    ----------
+    n_cols: int
+        number of columns (ie number of random streams) to create
+    seed: int, np.random.SeedSequence or None, optional
+        seed for the random streams. The same seed always gives the same streams.
+
+    Returns
+    -------
+    generators: list
+        list of np.random.Generator, one per column position
+    """
+    return [np.random.default_rng(child) for child in get_seed_sequences(n_cols, seed)]
+
+
+def _map_columns(func, columns, generators, threads):
+    # Run func(column, generator) for each column in a thread pool, keeping the order
+    if threads is None:
+        return list(map(func, columns, generators))
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(func, columns, generators))
+
+
+def _num_contaminated_per_column(data, n_cols, corruption_level):
+    # Same share of data points as get_random_indices, spread evenly over n_cols columns
+    prop_contaminated = np.linspace(0, 0.6, 11)[corruption_level]
+
+    return int(prop_contaminated * data.size / max(n_cols, 1))
+
+
+def get_num_duplicated(n, corruption_level=4):
+    """
+    Get the number of rows or columns added by the duplicate functions
+
+    Parameters
+    ----------
+    n: int
+        number of rows or columns in the clean dataset
+    corruption_level: int, optional
+        level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
+        is the highest level of contamination
+
+    Returns
+    -------
+    n_duplicated: int
+        number of duplicated rows or columns
+    """
+    return int(np.ceil(n * (0.2 * corruption_level / 10)))
+
+
+def get_untidy_shape(
+    clean_data, corruption_level=4, duplicate_rows=True, duplicate_columns=True
+):
+    """
+    Get the shape of the contaminated data, eg. to allocate an output memmap for untidyfy.
+
+    Parameters
+    ----------
+    clean_data: pd.DataFrame or np.ndarray
+        dataset to be corrupted
+    corruption_level: int, optional
+        level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
+        is the highest level of contamination
+    duplicate_rows: boolean, optional
+        Whether some rows of the data will be duplicated. Defaults to True.
+    duplicate_columns: boolean, optional
+        Whether some columns of the data will be duplicated. Only applies to 2-D data.
+        Defaults to True.
+
+    Examples
+    -------
+    >>> out = np.lib.format.open_memmap(
+    ...     "messy.npy", mode="w+", dtype=clean.dtype, shape=get_untidy_shape(clean)
+    ... )
+
+    Returns
+    -------
+    shape: tuple
+        shape of the contaminated dataset
+    """
+    shape = list(clean_data.shape)
+    if duplicate_rows:
+        shape[0] += get_num_duplicated(shape[0], corruption_level)
+    if duplicate_columns and len(shape) == 2 and clean_data.dtype.names is None:
+        shape[1] += get_num_duplicated(shape[1], corruption_level)
+
+    return tuple(shape)
+
+
+""" Helpers for NumPy arrays """
+
+
+def _array_columns(data):
+    # Columns of an array: fields of structured arrays, positions of 2-D arrays
+    if data.dtype.names is not None:
+        return list(data.dtype.names)
+    elif data.ndim == 2:
+        return list(range(data.shape[1]))
+    elif data.ndim == 1:
+        return [None]
+    else:
+        raise ValueError("data should be a 1-D, 2-D or structured array")
+
+
+def _column_view(block, col):
+    # View (not copy) of one column of a block, so that writes go to the block
+    if block.dtype.names is not None:
+        return block[col]
+    elif col is not None:
+        return block[:, col]
+    else:
+        return block
+
+
+def _missing_value(dtype):
+    # Value marking missing data in a column of the given dtype, None if there is none
+    if dtype.kind in "fcO":
+        return np.nan
+    elif dtype.kind in "US":
+        return "?"
+    elif dtype.kind in "mM":
+        return dtype.type("NaT")
+    else:
+        return None
+
+
+def _iter_blocks(n_rows, block_size):
+    # Row ranges of consecutive blocks
+    for start in range(0, n_rows, block_size):
+        yield start, min(start + block_size, n_rows)
+
+
+def _check_out(clean_data, out, shape):
+    # Allocate the output in memory if none is given, otherwise check its shape and dtype
+    if out is None:
+        return np.empty(shape, dtype=clean_data.dtype)
+    if out.shape != tuple(shape):
+        raise ValueError(f"out should have shape {tuple(shape)}, got {out.shape}")
+    if out.dtype != clean_data.dtype:
+        raise ValueError(f"out should have dtype {clean_data.dtype}, got {out.dtype}")
+    return out
+
+
+def _holds(out, clean_data):
+    # Whether the first rows of out are clean_data itself, so there is nothing to copy
+    head = out[: len(clean_data)]
+    return (
+        head.shape == clean_data.shape
+        and head.strides == clean_data.strides
+        and head.__array_interface__["data"][0]
+        == clean_data.__array_interface__["data"][0]
+    )
+
+
+def _flush(out):
+    if isinstance(out, np.memmap):
+        out.flush()
+
+
+def _contaminate_blocks(
+    clean_data, out, contaminators, block_size, col_order=None, threads=None
+):
+    # Read each block of clean_data once, contaminate it in memory and write it to out
+    if not contaminators and col_order is None and _holds(out, clean_data):
+        return
+
+    if threads is None:
+        _write_blocks(clean_data, out, contaminators, block_size, col_order, map)
+    else:
+        # One pool for all blocks, the columns of each block are contaminated concurrently
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            _write_blocks(
+                clean_data, out, contaminators, block_size, col_order, executor.map
+            )
+
+
+def _write_blocks(clean_data, out, contaminators, block_size, col_order, map_columns):
+    for start, stop in _iter_blocks(len(clean_data), block_size):
+        block = np.array(clean_data[start:stop])
+        for contaminate in contaminators:
+            contaminate(block, map_columns)
+        if col_order is not None:
+            block = block[:, col_order]
+        out[start:stop] = block
+
+
+def _append_rows(clean_data, out, rows, block_size):
+    # Write the given rows of clean_data after its copy in out, one block at a time
+    n_rows = len(clean_data)
+    for start, stop in _iter_blocks(len(rows), block_size):
+        out[n_rows + start : n_rows + stop] = clean_data[rows[start:stop]]
+
+
+def _outlier_contaminator(clean_data, corruption_level, seed, block_size):
+    # Function adding outliers to the numeric columns of a block of clean_data
+    all_cols = _array_columns(clean_data)
+    numeric_cols = [
+        col for col in all_cols if _column_view(clean_data, col).dtype.kind in "iuf"
+    ]
+    generators = dict(zip(all_cols, get_column_generators(len(all_cols), seed=seed)))
+
+    # Find the range of numeric columns, reading one block at a time
+    lows = {col: np.inf for col in numeric_cols}
+    highs = {col: -np.inf for col in numeric_cols}
+    for start, stop in _iter_blocks(len(clean_data), block_size):
+        block = clean_data[start:stop]
+        for col in numeric_cols:
+            values = _column_view(block, col)
+            if values.dtype.kind == "f":
+                values = values[~np.isnan(values)]
+            if values.size:
+                lows[col] = min(lows[col], float(values.min()))
+                highs[col] = max(highs[col], float(values.max()))
+
+    # Skip empty, constant and all-NaN columns, which have no magnitude to scale by
+    ranges = {col: highs[col] - lows[col] for col in numeric_cols}
+    outlier_cols = [
+        col for col in numeric_cols if np.isfinite(ranges[col]) and ranges[col] > 0
+    ]
+    magnitudes = {col: np.ceil(np.log10(ranges[col])) for col in outlier_cols}
+    outlier_generators = [generators[col] for col in outlier_cols]
+
+    # Same share of data points as for DataFrames, spread over the numeric columns
+    prop_contaminated = min(
+        1.0,
+        np.linspace(0, 0.6, 11)[corruption_level]
+        * len(all_cols)
+        / max(len(numeric_cols), 1),
+    )
+
+    def contaminate(block, map_columns):
+        def add_outliers_to_column(col, rng):
+            mask = rng.random(len(block)) < prop_contaminated
+            values = _column_view(block, col)
+            outliers = values[mask] * 10.0 ** (magnitudes[col] + 2)
+            if values.dtype.kind in "iu":
+                # Clip to the range of the integer type, so the cast back cannot overflow
+                info = np.iinfo(values.dtype)
+                outliers = np.clip(outliers, info.min, np.nextafter(float(info.max), 0))
+            values[mask] = outliers
+
+        list(map_columns(add_outliers_to_column, outlier_cols, outlier_generators))
+
+    return contaminate
+
+
+def _nan_contaminator(clean_data, corruption_level, seed):
+    # Function inserting missing values in the columns of a block that can hold them
+    all_cols = _array_columns(clean_data)
+    generators = get_column_generators(len(all_cols), seed=seed)
+    missing_values = [_missing_value(_column_view(clean_data, col).dtype) for col in all_cols]
+    nan_cols = [col for col, missing in zip(all_cols, missing_values) if missing is not None]
+    nan_generators = [
+        rng for rng, missing in zip(generators, missing_values) if missing is not None
+    ]
+    prop_contaminated = np.linspace(0, 0.6, 11)[corruption_level]
+
+    def contaminate(block, map_columns):
+        def add_nans_to_column(col, rng):
+            values = _column_view(block, col)
+            mask = rng.random(len(block)) < prop_contaminated
+            values[mask] = _missing_value(values.dtype)
+
+        list(map_columns(add_nans_to_column, nan_cols, nan_generators))
+
+    return contaminate
+
+
+def _duplicate_rows_choice(n_rows, corruption_level, seed):
+    # Rows to duplicate
+    rng = get_column_generators(1, seed=seed)[0]
+    return rng.choice(
+        n_rows, size=get_num_duplicated(n_rows, corruption_level), replace=False
+    )
+
+
+def _duplicate_columns_order(n_cols, corruption_level, seed):
+    # Shuffled column order, including the duplicated columns
+    rng = get_column_generators(1, seed=seed)[0]
+    dupes = rng.choice(
+        n_cols, size=get_num_duplicated(n_cols, corruption_level), replace=False
+    )
+    return rng.permutation(np.concatenate([np.arange(n_cols), dupes]))
+
+
+def _add_outliers_to_array(
+    clean_data, corruption_level, out, seed, block_size, threads
+):
+    out = _check_out(clean_data, out, clean_data.shape)
+    contaminate = _outlier_contaminator(clean_data, corruption_level, seed, block_size)
+    _contaminate_blocks(clean_data, out, [contaminate], block_size, threads=threads)
+
+    _flush(out)
+    return out
+
+
+def _add_nans_to_array(clean_data, corruption_level, out, seed, block_size, threads):
+    out = _check_out(clean_data, out, clean_data.shape)
+    contaminate = _nan_contaminator(clean_data, corruption_level, seed)
+    _contaminate_blocks(clean_data, out, [contaminate], block_size, threads=threads)
+
+    _flush(out)
+    return out
+
+
+def _add_duplicate_rows_to_array(clean_data, corruption_level, out, seed, block_size):
+    out = _check_out(
+        clean_data, out, get_untidy_shape(clean_data, corruption_level, True, False)
+    )
+    dupes = _duplicate_rows_choice(len(clean_data), corruption_level, seed)
+    _contaminate_blocks(clean_data, out, [], block_size)
+    _append_rows(clean_data, out, dupes, block_size)
+
+    _flush(out)
+    return out
+
+
+def _add_duplicate_columns_to_array(
+    clean_data, corruption_level, out, seed, block_size
+):
+    if clean_data.ndim != 2 or clean_data.dtype.names is not None:
+        raise TypeError("clean_data should be a 2-D array with no fields")
+
+    out = _check_out(
+        clean_data, out, get_untidy_shape(clean_data, corruption_level, False, True)
+    )
+    col_order = _duplicate_columns_order(clean_data.shape[1], corruption_level, seed)
+
+    # Fancy indexing copies the block before writing, so out may overlap clean_data
+    _contaminate_blocks(clean_data, out, [], block_size, col_order)
+
+    _flush(out)
+    return out
+
+
 """ Functions to contaminate text columns """
 
 
-def add_noise_to_strings(clean_data, corruption_level=4):
+def add_noise_to_strings(clean_data, corruption_level=4, seed=None):
     """
     Introduce noise to strings in clean data
 
@@ -132,6 +525,9 @@ def add_noise_to_strings(clean_data, corruption_level=4):
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    seed: int or np.random.SeedSequence, optional
+        Seed for the random choices, which then give the same output for the same seed.
+        Uses the global random state if None. Defaults to None.
 
     Returns
     -------
@@ -139,10 +535,11 @@ def add_noise_to_strings(clean_data, corruption_level=4):
         contaminated dataset
     """
     data = clean_data.copy()
+    rng = None if seed is None else get_column_generators(1, seed=seed)[0]
 
     # Find data cells to contaminate
     idxs_to_contaminate = get_random_indices(
-        data, col_type="str", corruption_level=corruption_level
+        data, col_type="str", corruption_level=corruption_level, rng=rng
     )
 
     # Perform contamination
@@ -150,13 +547,16 @@ def add_noise_to_strings(clean_data, corruption_level=4):
 
     for idx in idxs_to_contaminate:
         # Add a superfluous character
-        noise = random.choice(noise_chars)
+        if rng is None:
+            noise = random.choice(noise_chars)
+        else:
+            noise = noise_chars[rng.integers(len(noise_chars))]
         data.iloc[idx] = str(data.iloc[idx]).replace("nan", "") + noise
 
     return data
 
 
-def change_str_encoding(clean_data, corruption_level=4):
+def change_str_encoding(clean_data, corruption_level=4, seed=None):
     """
     Changes the string encoding of text data.
 
@@ -167,6 +567,9 @@ def change_str_encoding(clean_data, corruption_level=4):
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    seed: int or np.random.SeedSequence, optional
+        Seed for the random choices, which then give the same output for the same seed.
+        Uses the global random state if None. Defaults to None.
 
     Returns
     -------
@@ -174,10 +577,11 @@ def change_str_encoding(clean_data, corruption_level=4):
         contaminated dataset
     """
     data = clean_data.copy()
+    rng = None if seed is None else get_column_generators(1, seed=seed)[0]
 
     if isinstance(data, pd.DataFrame):
         # Find random columns to contaminate
-        cols_to_contaminate = get_random_cols(data, col_type="str")
+        cols_to_contaminate = get_random_cols(data, col_type="str", rng=rng)
 
         # Change encoding of columns
         for col in cols_to_contaminate:
@@ -200,7 +604,7 @@ def change_str_encoding(clean_data, corruption_level=4):
 """ Functions to contaminate numerical columns """
 
 
-def change_numeric_to_str(clean_data, corruption_level=4):
+def change_numeric_to_str(clean_data, corruption_level=4, seed=None):
     """
     Changes the dtype in some numeric columns to strings
 
@@ -211,6 +615,9 @@ def change_numeric_to_str(clean_data, corruption_level=4):
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    seed: int or np.random.SeedSequence, optional
+        Seed for selecting columns, which then give the same output for the same seed.
+        Uses the global random state if None. Defaults to None.
 
     Returns
     -------
@@ -221,7 +628,8 @@ def change_numeric_to_str(clean_data, corruption_level=4):
 
     if isinstance(data, pd.DataFrame):
         # Find random columns to contaminate
-        cols_to_contaminate = get_random_cols(data, col_type="numeric")
+        rng = None if seed is None else get_column_generators(1, seed=seed)[0]
+        cols_to_contaminate = get_random_cols(data, col_type="numeric", rng=rng)
 
         # Change dtype of columns
         for col in cols_to_contaminate:
@@ -236,25 +644,84 @@ def change_numeric_to_str(clean_data, corruption_level=4):
     return data
 
 
-def add_outliers(clean_data, corruption_level=4):
+def _add_outliers_to_column(col, rng, num_contaminated):
+    # Multiply randomly chosen rows by a power of ten above the range of the column
+    magnitude = np.ceil(np.log10((col.max() - col.min())))
+    mask = np.zeros(len(col), dtype=bool)
+    mask[rng.integers(0, len(col), size=num_contaminated)] = True
+
+    return col.mask(mask, col * 10 ** (magnitude + 2))
+
+
+def add_outliers(
+    clean_data,
+    corruption_level=4,
+    threads=None,
+    seed=None,
+    out=None,
+    block_size=65536,
+):
     """
     Contaminate data with obvious outliers
 
     Parameters
     ----------
-    clean_data: pd.Series or pd.DataFrame
-        data to be contaminated with missing values
+    clean_data: pd.Series, pd.DataFrame or np.ndarray
+        data to be contaminated with outliers. NumPy arrays can be 1-D, 2-D or structured, and
+        their numeric columns are contaminated one block of rows at a time
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    threads: int, optional
+        If set, contaminate each column with its own random stream in a thread pool with
+        this many workers. Defaults to None (no threads).
+    seed: int or np.random.SeedSequence, optional
+        Seed for the per-column random streams, which then give the same output for the
+        same seed whatever the number of threads. Uses the global random state if None and
+        threads is not set. Defaults to None.
+    out: np.ndarray or np.memmap, optional
+        Output for NumPy array inputs, with the same shape and dtype as clean_data. Allocated
+        in memory if None. Pass a memmap to process arrays larger than memory. Defaults to None.
+    block_size: int, optional
+        Number of rows of NumPy array inputs read and written at a time. Defaults to 65536.
 
     Returns
     -------
-    data: pd.DataFrame or pd.Series
+    data: pd.DataFrame, pd.Series or np.ndarray
         contaminated dataset
     """
+    if isinstance(clean_data, np.ndarray):
+        return _add_outliers_to_array(
+            clean_data, corruption_level, out, seed, block_size, threads
+        )
+
     data = clean_data.copy()
 
+    if threads is not None or seed is not None:
+        if isinstance(data, pd.DataFrame):
+            numeric_cols = list(data.select_dtypes(include=np.number).columns)
+            generators = get_column_generators(len(data.columns), seed=seed)
+            col_positions = [list(data.columns).index(col) for col in numeric_cols]
+            num_contaminated = _num_contaminated_per_column(
+                data, len(numeric_cols), corruption_level
+            )
+            outliers = _map_columns(
+                lambda col, rng: _add_outliers_to_column(col, rng, num_contaminated),
+                [data[col] for col in numeric_cols],
+                [generators[i] for i in col_positions],
+                threads,
+            )
+            for col, values in zip(numeric_cols, outliers):
+                data[col] = values
+        elif isinstance(data, pd.Series):
+            rng = get_column_generators(1, seed=seed)[0]
+            num_contaminated = _num_contaminated_per_column(data, 1, corruption_level)
+            data = _add_outliers_to_column(data, rng, num_contaminated)
+        else:
+            raise TypeError("clean_data should be pd.Series or pd.DataFrame")
+
+        return data
+
     # Find magnitude for numeric columns (ie number of zeros in the range of the variable)
     if isinstance(data, pd.DataFrame):
         numeric_cols = list(data.select_dtypes(include=np.number).columns)
@@ -285,25 +752,94 @@ def add_outliers(clean_data, corruption_level=4):
 """ Functions to contaminate any column """
 
 
-def add_nans(clean_data, corruption_level=4):
+def _add_nans_to_column(col, rng, num_contaminated):
+    # Replace randomly chosen rows with NaN (90%) or ? (10%), categories only get NaN
+    rows = rng.integers(0, len(col), size=num_contaminated)
+    biased_coin_flips = rng.random(num_contaminated) < 0.9
+    if col.dtype == "category":
+        biased_coin_flips[:] = True
+
+    nan_mask = np.zeros(len(col), dtype=bool)
+    nan_mask[rows[biased_coin_flips]] = True
+    question_mask = np.zeros(len(col), dtype=bool)
+    question_mask[rows[~biased_coin_flips]] = True
+    question_mask &= ~nan_mask
+
+    col = col.mask(nan_mask)
+    if question_mask.any():
+        col = col.astype(object).mask(question_mask, "?")
+
+    return col
+
+
+def add_nans(
+    clean_data,
+    corruption_level=4,
+    threads=None,
+    seed=None,
+    out=None,
+    block_size=65536,
+):
     """
     Introduce missing values in clean data
 
     Parameters
     ----------
-    clean_data: pd.Series or pd.DataFrame
-        data to be contaminated with missing values
+    clean_data: pd.Series, pd.DataFrame or np.ndarray
+        data to be contaminated with missing values. NumPy arrays can be 1-D, 2-D or
+        structured, and are contaminated one block of rows at a time. Float and object
+        columns get NaN, string columns get '?', datetime columns get NaT and other columns
+        are left as is
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    threads: int, optional
+        If set, contaminate each column with its own random stream in a thread pool with
+        this many workers. Defaults to None (no threads).
+    seed: int or np.random.SeedSequence, optional
+        Seed for the per-column random streams, which then give the same output for the
+        same seed whatever the number of threads. Uses the global random state if None and
+        threads is not set. Defaults to None.
+    out: np.ndarray or np.memmap, optional
+        Output for NumPy array inputs, with the same shape and dtype as clean_data. Allocated
+        in memory if None. Pass a memmap to process arrays larger than memory. Defaults to None.
+    block_size: int, optional
+        Number of rows of NumPy array inputs read and written at a time. Defaults to 65536.
 
     Returns
     -------
-    data: pd.DataFrame or pd.Series
+    data: pd.DataFrame, pd.Series or np.ndarray
         contaminated dataset
     """
+    if isinstance(clean_data, np.ndarray):
+        return _add_nans_to_array(
+            clean_data, corruption_level, out, seed, block_size, threads
+        )
+
     data = clean_data.copy()
 
+    if threads is not None or seed is not None:
+        if isinstance(data, pd.DataFrame):
+            num_contaminated = _num_contaminated_per_column(
+                data, len(data.columns), corruption_level
+            )
+            nan_cols = _map_columns(
+                lambda col, rng: _add_nans_to_column(col, rng, num_contaminated),
+                [data.iloc[:, i] for i in range(len(data.columns))],
+                get_column_generators(len(data.columns), seed=seed),
+                threads,
+            )
+            data = pd.concat(nan_cols, axis=1)
+            data.columns = clean_data.columns
+        elif isinstance(data, pd.Series):
+            rng = get_column_generators(1, seed=seed)[0]
+            num_contaminated = _num_contaminated_per_column(data, 1, corruption_level)
+            data = _add_nans_to_column(data, rng, num_contaminated)
+        else:
+            raise TypeError("clean_data should be pd.Series or pd.DataFrame")
+
+        return data
+
     # Find random data cells to contaminate
     nan_idxs = get_random_indices(
         data, col_type="any", corruption_level=corruption_level
@@ -336,65 +872,209 @@ def add_nans(clean_data, corruption_level=4):
 """ Functions for duplications: """
 
 
-def add_duplicate_rows(clean_data, corruption_level=4):
+def add_duplicate_rows(
+    clean_data, corruption_level=4, seed=None, out=None, block_size=65536
+):
     """
     Add extra rows in a dataset
 
     Parameters
     ----------
-    clean_data: pd.DataFrame
+    clean_data: pd.DataFrame or np.ndarray
         dataset to be contaminated
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    seed: int or np.random.SeedSequence, optional
+        Seed for the random choices, which then give the same output for the same seed.
+        Uses the global random state for DataFrames if None. Defaults to None.
+    out: np.ndarray or np.memmap, optional
+        Output for NumPy array inputs, with the shape given by `get_untidy_shape` and the
+        dtype of clean_data. Allocated in memory if None. Pass a memmap to process arrays
+        larger than memory. Defaults to None.
+    block_size: int, optional
+        Number of rows of NumPy array inputs read and written at a time. Defaults to 65536.
 
     Returns
     -------
-    data: pd.DataFrame
+    data: pd.DataFrame or np.ndarray
         data with duplicated rows
     """
+    if isinstance(clean_data, np.ndarray):
+        return _add_duplicate_rows_to_array(
+            clean_data, corruption_level, out, seed, block_size
+        )
+
     data = clean_data.copy()
     n_rows, _ = data.shape
-    n_rows_duplicated = int(np.ceil(n_rows * (0.2 * corruption_level / 10)))
+    n_rows_duplicated = get_num_duplicated(n_rows, corruption_level)
 
-    dupes = data.sample(n=n_rows_duplicated, axis=0)
+    if seed is None:
+        dupes = data.sample(n=n_rows_duplicated, axis=0)
+    else:
+        rng = get_column_generators(1, seed=seed)[0]
+        dupes = data.iloc[rng.choice(n_rows, size=n_rows_duplicated, replace=False)]
     data = pd.concat([data, dupes], axis=0, ignore_index=True)
 
     return data
 
 
-def add_duplicate_columns(clean_data, corruption_level=4):
+def add_duplicate_columns(
+    clean_data, corruption_level=4, seed=None, out=None, block_size=65536
+):
     """
     Add extra columns in a dataset
 
     Parameters
     ----------
-    clean_data: pd.DataFrame
-        dataset to be contaminated
+    clean_data: pd.DataFrame or np.ndarray
+        dataset to be contaminated. NumPy arrays should be 2-D and not structured.
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination
+    seed: int or np.random.SeedSequence, optional
+        Seed for the random choices, which then give the same output for the same seed.
+        Uses the global random state for DataFrames if None. Defaults to None.
+    out: np.ndarray or np.memmap, optional
+        Output for NumPy array inputs, with the shape given by `get_untidy_shape` and the
+        dtype of clean_data. Allocated in memory if None. Pass a memmap to process arrays
+        larger than memory. Defaults to None.
+    block_size: int, optional
+        Number of rows of NumPy array inputs read and written at a time. Defaults to 65536.
 
     Returns
     -------
-    data: pd.DataFrame
+    data: pd.DataFrame or np.ndarray
         data with duplicated columns
     """
+    if isinstance(clean_data, np.ndarray):
+        return _add_duplicate_columns_to_array(
+            clean_data, corruption_level, out, seed, block_size
+        )
+
     data = clean_data.copy()
     _, n_cols = data.shape
-    n_cols_duplicated = int(np.ceil(n_cols * (0.2 * corruption_level / 10)))
+    n_cols_duplicated = get_num_duplicated(n_cols, corruption_level)
+
+    rng = None if seed is None else get_column_generators(1, seed=seed)[0]
 
-    dupes = data.sample(n=n_cols_duplicated, axis=1)
+    if rng is None:
+        dupes = data.sample(n=n_cols_duplicated, axis=1)
+    else:
+        dupes = data.iloc[
+            :, rng.choice(n_cols, size=n_cols_duplicated, replace=False)
+        ]
     data = pd.concat([data, dupes], axis=1, ignore_index=True)
 
     # Add new names to duplicate columns
-    dup_col_names = [c + random.choice(string.ascii_lowercase) for c in dupes.columns]
+    if rng is None:
+        suffixes = [random.choice(string.ascii_lowercase) for _ in dupes.columns]
+    else:
+        suffixes = list(rng.choice(list(string.ascii_lowercase), size=len(dupes.columns)))
+    dup_col_names = [c + suffix for c, suffix in zip(dupes.columns, suffixes)]
     data.columns = clean_data.columns.tolist() + dup_col_names
 
     # Shuffle the columns of the data
-    new_col_order = np.random.choice(
-        data.columns, size=len(data.columns), replace=False
-    )
+    if rng is None:
+        new_col_order = np.random.choice(
+            data.columns, size=len(data.columns), replace=False
+        )
+    else:
+        new_col_order = rng.permutation(data.columns)
     data = data[new_col_order]
 
     return data
+
+
+""" Functions for NumPy arrays """
+
+
+def contaminate_array(
+    clean_data,
+    corruption_level=4,
+    nans=True,
+    outliers=True,
+    duplicate_rows=True,
+    duplicate_columns=True,
+    threads=None,
+    seed=None,
+    out=None,
+    block_size=65536,
+):
+    """
+    Contaminate a NumPy array, reading and writing each block of rows once
+
+    Parameters
+    ----------
+    clean_data: np.ndarray
+        dataset to be contaminated, 1-D, 2-D or structured. Can be a memmap.
+    corruption_level: int, optional
+        level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
+        is the highest level of contamination
+    nans: boolean, optional
+        Whether to insert missing values, as in `add_nans`. Defaults to True.
+    outliers: boolean, optional
+        Whether to add outliers, as in `add_outliers`. Defaults to True.
+    duplicate_rows: boolean, optional
+        Whether to duplicate some rows. Defaults to True.
+    duplicate_columns: boolean, optional
+        Whether to duplicate some columns. Only applies to 2-D arrays. Defaults to True.
+    threads: int, optional
+        If set, add outliers and missing values to the columns of each block in a thread pool
+        with this many workers. Defaults to None (no threads).
+    seed: int or np.random.SeedSequence, optional
+        Seed for the random choices, which then give the same output for the same seed,
+        whatever the number of threads and the block size. Defaults to None.
+    out: np.ndarray or np.memmap, optional
+        Output with the shape given by `get_untidy_shape` and the dtype of clean_data.
+        Allocated in memory if None. Pass a memmap to process arrays larger than memory.
+        Defaults to None.
+    block_size: int, optional
+        Number of rows read and written at a time. Defaults to 65536.
+
+    Returns
+    -------
+    data: np.ndarray
+        contaminated dataset
+    """
+    duplicate_columns = (
+        duplicate_columns and clean_data.ndim == 2 and clean_data.dtype.names is None
+    )
+    out = _check_out(
+        clean_data,
+        out,
+        get_untidy_shape(
+            clean_data, corruption_level, duplicate_rows, duplicate_columns
+        ),
+    )
+
+    # Same random streams for each step as untidyfy uses for DataFrames
+    outliers_seed, _, _, _, nans_seed, rows_seed, cols_seed = get_seed_sequences(
+        7, seed
+    )
+
+    # Outliers and missing values are added to each block in memory
+    contaminators = []
+    if outliers:
+        contaminators.append(
+            _outlier_contaminator(clean_data, corruption_level, outliers_seed, block_size)
+        )
+    if nans:
+        contaminators.append(_nan_contaminator(clean_data, corruption_level, nans_seed))
+    if duplicate_columns:
+        col_order = _duplicate_columns_order(
+            clean_data.shape[1], corruption_level, cols_seed
+        )
+    else:
+        col_order = None
+    _contaminate_blocks(
+        clean_data, out, contaminators, block_size, col_order, threads=threads
+    )
+
+    # Duplicated rows are copied from the already contaminated rows of out
+    if duplicate_rows:
+        dupes = _duplicate_rows_choice(len(clean_data), corruption_level, rows_seed)
+        _append_rows(out[: len(clean_data)], out, dupes, block_size)
+
+    _flush(out)
+    return out
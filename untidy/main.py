@@ -1,3 +1,5 @@
+import numpy as np
+
 from untidy.contaminators import *
 
 
@@ -17,14 +19,20 @@ def untidyfy(
     duplicate_rows=True,
     duplicate_columns=True,
     verbose=True,
+    threads=None,
+    seed=None,
+    out=None,
+    block_size=65536,
 ):
     """
     Contaminate a dataset with various types of data issues.
 
     Parameters
     ----------
-    clean_data: pd.DataFrame
-        dataset to be corrupted
+    clean_data: pd.DataFrame or np.ndarray
+        dataset to be corrupted. NumPy arrays (including memmaps and structured arrays) only
+        get missing values, outliers and duplicates, and are processed one block of rows at
+        a time.
     corruption_level: int, optional
         level of corruption, should be between 0 and 10, where 0 leaves the dataset as is, 10
         is the highest level of contamination.  Defaults to 4.
@@ -43,6 +51,20 @@ def untidyfy(
     duplicate_columns: boolean, optional
         Whether to duplicate some columns of the data. Defaults to True.
     verbose: boolean, optional
+    threads: int, optional
+        If set, run the outlier and missing value steps column by column in a thread pool
+        with this many workers, each column with its own random stream.
+        Defaults to None (no threads).
+    seed: int, optional
+        Seed for all the steps, which then give the same output for the same seed whatever
+        the number of threads (and, for NumPy arrays, the block size). Uses the global random
+        state if None.  Defaults to None.
+    out: np.ndarray or np.memmap, optional
+        Output for NumPy array inputs, with the shape given by `get_untidy_shape` and the
+        dtype of clean_data. Allocated in memory if None. Pass a memmap to process arrays
+        larger than memory.  Defaults to None.
+    block_size: int, optional
+        Number of rows of NumPy array inputs read and written at a time. Defaults to 65536.
 
     Examples
     -------
@@ -50,34 +72,99 @@ def untidyfy(
 
     Returns
     -------
-    data: pd.DataFrame
+    data: pd.DataFrame or np.ndarray
         contaminated dataset
     """
     _user_log("Your dataset is being messed up...", verbose)
+
+    if isinstance(clean_data, np.ndarray):
+        skipped = [
+            name
+            for step, name in [
+                (text_noise, "noise"),
+                (mess_with_string_encodings, "string encodings"),
+                (mess_with_numbers, "numbers as strings"),
+            ]
+            if step
+        ]
+        if skipped:
+            _user_log(
+                f"\tSkipping {', '.join(skipped)}, which only apply to DataFrames...",
+                verbose,
+            )
+        for step, statement in [
+            (outliers, "\tAdding outliers..."),
+            (nans, "\tAdding missing values..."),
+            (duplicate_rows, "\tAdding duplicate rows..."),
+            (duplicate_columns, "\tAdding duplicate columns..."),
+        ]:
+            if step:
+                _user_log(statement, verbose)
+        data = contaminate_array(
+            clean_data,
+            corruption_level=corruption_level,
+            nans=nans,
+            outliers=outliers,
+            duplicate_rows=duplicate_rows,
+            duplicate_columns=duplicate_columns,
+            threads=threads,
+            seed=seed,
+            out=out,
+            block_size=block_size,
+        )
+        _user_log("\nYour untidy dataset is ready.", verbose)
+        return data
+
     data = clean_data.copy()
 
+    # Independent random streams for each step
+    if seed is None:
+        seeds = [None] * 7
+    else:
+        seeds = get_seed_sequences(7, seed)
+    (
+        outliers_seed,
+        noise_seed,
+        encoding_seed,
+        numbers_seed,
+        nans_seed,
+        rows_seed,
+        cols_seed,
+    ) = seeds
+
     # Contaminate
     if outliers:
         _user_log("\tAdding outliers...", verbose)
-        data = add_outliers(data, corruption_level=corruption_level)
+        data = add_outliers(
+            data,
+            corruption_level=corruption_level,
+            threads=threads,
+            seed=outliers_seed,
+        )
     if text_noise:
         _user_log("\tAdding noise...", verbose)
-        data = add_noise_to_strings(data, corruption_level)
+        data = add_noise_to_strings(data, corruption_level, seed=noise_seed)
     if mess_with_string_encodings:
         _user_log("\tMessing with strings...", verbose)
-        data = change_str_encoding(data, corruption_level)
+        data = change_str_encoding(data, corruption_level, seed=encoding_seed)
     if mess_with_numbers:
         _user_log("\tMessing with numbers....", verbose)
-        data = change_numeric_to_str(data, corruption_level)
+        data = change_numeric_to_str(data, corruption_level, seed=numbers_seed)
     if nans:
         _user_log("\tAdding missing values...", verbose)
-        data = add_nans(data, corruption_level=corruption_level)
+        data = add_nans(
+            data, corruption_level=corruption_level, threads=threads, seed=nans_seed
+        )
     if duplicate_rows:
         _user_log("\tAdding duplicate rows...", verbose)
-        data = add_duplicate_rows(data, corruption_level=corruption_level)
+        data = add_duplicate_rows(
+            data, corruption_level=corruption_level, seed=rows_seed
+        )
     if duplicate_columns:
         _user_log("\tAdding duplicate columns...", verbose)
-        data = add_duplicate_columns(data, corruption_level=corruption_level)
+        data = add_duplicate_columns(
+            data, corruption_level=corruption_level, seed=cols_seed
+        )
 
     _user_log("\nYour untidy dataset is ready.", verbose)
 